@@ -1,12 +1,172 @@
 """
 Core components that represent objects inside Liquid node like a Wallet.
 """
+import json
+import logging
+from decimal import Decimal
+from functools import lru_cache
+from itertools import count
 from uuid import uuid4
-from typing import Optional, Callable, Union
+from typing import Any, List, Optional, Tuple, Union
 
-from bitcoinrpc.authproxy import AuthServiceProxy  # type: ignore
+import httpx
 from mnemonic import Mnemonic  # type: ignore
-from pyliquid.liquid.wrappers import rpc_exec
+from pyliquid.liquid.wrappers import rpc_exec, ttl_cache
+from pyliquid.utils.exceptions import JSONRPCError
+
+_RPC_IDS = count()
+LISTING_TTL = 2.0
+
+
+def _encode_decimal(value: Any) -> float:
+    """
+    Encode `Decimal` amounts for JSON-RPC calls, as the node expects
+    numbers with up to 8 decimals.
+
+    Parameters
+    ----------
+    value: Any
+        Object that `json` could not serialize by itself.
+
+    Returns
+    -------
+    float
+    """
+    if isinstance(value, Decimal):
+        return float(round(value, 8))
+    raise TypeError(f"{repr(value)} is not JSON serializable")
+
+
+def _rpc_payload(response: httpx.Response) -> Any:
+    """
+    Decode the body of a JSON-RPC response from the node. Amounts are
+    decoded as `Decimal` to keep their precision.
+
+    Parameters
+    ----------
+    response: httpx.Response
+        Raw response of the HTTP POST to the node.
+
+    Returns
+    -------
+    Any
+        A response object, or a list of them for batched calls.
+    """
+    try:
+        return json.loads(response.content, parse_float=Decimal)
+    except ValueError:
+        # Errors like authentication failures come without a JSON body.
+        response.raise_for_status()
+        raise
+
+
+def _rpc_result(payload: dict) -> Any:
+    """
+    Extract the result of a single JSON-RPC response object.
+
+    Parameters
+    ----------
+    payload: dict
+        Decoded response object with `result` and `error` fields.
+
+    Returns
+    -------
+    Any
+        Content of the `result` field.
+    """
+    if payload.get('error'):
+        raise JSONRPCError(payload['error'])
+    return payload['result']
+
+
+@lru_cache(maxsize=8)
+def _mnemo(language: str) -> Mnemonic:
+    """
+    Return the mnemonic generator for a language. Its wordlist is read from
+    disk only the first time it is requested.
+
+    Parameters
+    ----------
+    language: str
+        The language of the dictionary to be used.
+
+    Returns
+    -------
+    Mnemonic
+    """
+    return Mnemonic(language)
+
+
+async def _rpc_post(proxy_service: httpx.AsyncClient, payload: Any) -> Any:
+    """
+    Send a JSON-RPC payload to the node and decode its reply.
+
+    Parameters
+    ---------
+    proxy_service: httpx.AsyncClient
+        Pooled RPC client to be used for the call.
+    payload: Any
+        A request object, or a list of them for batched calls.
+
+    Returns
+    -------
+    Any
+        A response object, or a list of them for batched calls.
+    """
+    response = await proxy_service.post(
+        "/", content=json.dumps(payload, default=_encode_decimal),
+        headers={"Content-Type": "application/json"})
+    return _rpc_payload(response)
+
+
+@rpc_exec
+async def _rpc(proxy_service: httpx.AsyncClient, _method: str, *params):
+    """
+    Execute a JSON-RPC call over the shared connection pool.
+
+    Parameters
+    ---------
+    proxy_service: httpx.AsyncClient
+        Pooled RPC client to be used for the call.
+    _method: str
+        Name of the RPC method to be called on the node.
+    *params:
+        Set of parameters to be passed down to the RPC method.
+
+    Returns
+    -------
+    Any
+        Output of the RPC call.
+    """
+    return _rpc_result(await _rpc_post(proxy_service, {
+        "jsonrpc": "1.0", "id": next(_RPC_IDS), "method": _method,
+        "params": list(params)}))
+
+
+@rpc_exec
+async def _rpc_batch(proxy_service: httpx.AsyncClient, batch: list) -> list:
+    """
+    Execute a batch of JSON-RPC calls over the shared connection pool.
+
+    Parameters
+    ---------
+    proxy_service: httpx.AsyncClient
+        Pooled RPC client to be used for the call.
+    batch: list
+        Request objects to be sent in a single POST.
+
+    Returns
+    -------
+    list
+        Raw reply objects from the node, in any order.
+    """
+    replies = await _rpc_post(proxy_service, batch)
+    if not isinstance(replies, list):
+        # The whole batch was rejected, like on a parse error.
+        if isinstance(replies, dict) and replies.get('error'):
+            raise JSONRPCError(replies['error'])
+        raise ValueError(f"Unexpected reply to a batch call: {replies}")
+    return replies
 
 
 class Wallet():
@@ -15,47 +175,92 @@ class Wallet():
 
     Attributes
     --------
-    _proxy: AuthServiceProxy
-        Authenticated Proxy Service to be used by the classmethods.
+    _proxy: httpx.AsyncClient
+        Pooled RPC client shared by every wallet instance.
+    _mode: str
+        How the wallet is obtained from the node when opened.
+    _label: Optional[str]
+        Name of the wallet at the node level.
+    _with_address: bool
+        If a new wallet should be created with one address.
     _wallet: Dict
         Resulting metadata of the wallet at the node level.
     """
 
-    _proxy: AuthServiceProxy
+    _proxy: httpx.AsyncClient
+    _mode: str
+    _label: Optional[str]
+    _with_address: bool
     _wallet: dict
 
-    def __init__(self, proxy_service: AuthServiceProxy,
+    def __init__(self, proxy_service: httpx.AsyncClient,
                  mode: Optional[str] = 'r',
                  wallet_label: Optional[str] = None,
                  with_address: bool = True) -> None:
         """
-        Constructor for Wallet class.
+        Constructor for Wallet class. No RPC call is made until the
+        wallet is opened with `open`.
 
         Parameters
         ---------
-        proxy: AuthServiceProxy
-            Authenticated Proxy Service to be used by troughout the class.
+        proxy: httpx.AsyncClient
+            Pooled RPC client to be used by troughout the class.
         with_address: bool, default = True
             If your wallet should have at least one address.
         """
-        self._proxy = proxy_service
-        if mode == 'c':
-            self._wallet = self._create_wallet(label=wallet_label,
-                                               address=with_address)
-        elif mode == 'r':
-            self._wallet = {}
-        elif mode == 'l':
-            self._wallet = self.load_wallet(wallet_label)
-        else:
+        if mode not in ('c', 'r', 'l'):
             raise NotImplementedError("Provide a valid Wallet mode!")
+        self._proxy = proxy_service
+        self._mode = mode
+        self._label = wallet_label
+        self._with_address = with_address
+        self._wallet = {}
+
+    async def open(self) -> 'Wallet':
+        """
+        Create or load the wallet at the node depending on its mode.
+
+        Returns
+        -------
+        Wallet
+            The same instance, with its metadata populated.
+        """
+        if self._mode == 'c':
+            self._wallet = await self._create_wallet(
+                label=self._label, address=self._with_address)
+            if self._wallet:
+                # Opening it again must only load it, never create it twice.
+                self._mode = 'l'
+        elif self._mode == 'l':
+            self._wallet = await self.load_wallet(self._label)
+            # The node refuses to load a wallet twice, but it is usable as is.
+            if not self._wallet and self._label in (
+                    await self.list_loaded_wallets() or []):
+                self._wallet = {"name": self._label}
+        return self
 
     @property
-    def proxy(self) -> AuthServiceProxy:
+    def proxy(self) -> httpx.AsyncClient:
         """
         Getter method for `proxy` attribute.
         """
         return self._proxy
 
+    @proxy.setter
+    def proxy(self, proxy_service: httpx.AsyncClient) -> None:
+        """
+        Setter method for `proxy` attribute, used when the shared client is
+        replaced.
+        """
+        self._proxy = proxy_service
+
+    @property
+    def label(self) -> Optional[str]:
+        """
+        Getter method for `label` attribute.
+        """
+        return self._label
+
     @property
     def wallet(self) -> dict:
         """
@@ -63,32 +268,47 @@ class Wallet():
         """
         return self._wallet
 
-    @classmethod
-    @rpc_exec
-    def _wrapper_executor(cls, _inst_func: Callable, *args):
+    async def _batch(self, calls: List[Tuple[str, list]]) -> list:
         """
-        Executor for wrapper functions to work withing instance methods.
+        Executor for several JSON-RPC calls in a single round-trip.
 
         Parameters
         ---------
-        _inst_func: Callable
-            Instance function to be used.
-        *args:
-            Set of parameters to be passed down to the function.
+        calls: list[tuple[str, list]]
+            Pairs of RPC method name and its parameters, in order of
+            execution.
 
         Returns
         -------
-        dict
-            Output of function execution.
-        """
-        if args:
-            # Unpacks and unnest args before passing it down to function.
-            return _inst_func(*args[0])
-        else:
-            return _inst_func()
-
-    def _create_wallet(self, address: bool, 
-                       label: Optional[str] = None) -> dict:
+        list
+            Output of each call in the same order. Failed calls are logged
+            and their output is `None`.
+        """
+        batch = [{"jsonrpc": "1.0", "id": next(_RPC_IDS), "method": _method,
+                  "params": list(params)} for _method, params in calls]
+        replies = await _rpc_batch(self._proxy, batch)
+        if replies is None:
+            return [None] * len(batch)
+        # The node is free to answer a batch in any order.
+        by_id = {reply.get('id'): reply for reply in replies
+                 if isinstance(reply, dict)}
+        outputs = []
+        for call in batch:
+            reply = by_id.get(call['id'])
+            if reply is None:
+                logging.error(f"No reply for RPC call '{call['method']}'\n")
+                outputs.append(None)
+                continue
+            try:
+                outputs.append(_rpc_result(reply))
+            except JSONRPCError as json_exception:
+                logging.error(
+                    f"A JSON RPC Exception occured: {json_exception}\n")
+                outputs.append(None)
+        return outputs
+
+    async def _create_wallet(self, address: bool,
+                             label: Optional[str] = None) -> dict:
         """
         Create a wallet from a random name.
 
@@ -106,13 +326,18 @@ class Wallet():
         """
         if not label:
             label = str(uuid4())
-        creation = self._wrapper_executor(self.proxy.createwallet, label,
-                                          False, False)
+        self._label = label
         if address:
-            output = self._wrapper_executor(self.proxy.getnewaddress)
+            creation, output = await self._batch([
+                ('createwallet', [label, False, False]),
+                ('getnewaddress', [])])
+            # Without the new wallet, the address belongs to another one.
+            if creation is None:
+                return None
             return output
         else:
-            return creation
+            return await _rpc(self._proxy, 'createwallet', label, False,
+                              False)
 
     def _generate_mnemonic(self, strength: Optional[int] = 256,
                            language: Optional[str] = "english") -> str:
@@ -131,10 +356,9 @@ class Wallet():
         str
             Resulting mnemonic phrase given its strenght.
         """
-        mnemo = Mnemonic(language)
-        return mnemo.generate(strength=strength)
+        return _mnemo(language).generate(strength=strength)
 
-    def list_wallets(self) -> list:
+    async def list_wallets(self) -> list:
         """
         Get all saved wallets at node directory.
 
@@ -143,9 +367,20 @@ class Wallet():
         dict
             Dictionary with a lists of wallets.
         """
-        return self._wrapper_executor(self.proxy.listwalletdir)
+        return await _rpc(self._proxy, 'listwalletdir')
 
-    def load_wallet(self, name: str) -> dict:
+    async def list_loaded_wallets(self) -> list:
+        """
+        Get the names of the wallets currently loaded by the node.
+
+        Returns
+        -------
+        list
+            List of wallet names.
+        """
+        return await _rpc(self._proxy, 'listwallets')
+
+    async def load_wallet(self, name: str) -> dict:
         """
         Load a wallet with a given filename.
 
@@ -159,9 +394,9 @@ class Wallet():
         dict
             Dictionary with the wallet details
         """
-        return self._wrapper_executor(self.proxy.loadwallet, name)
+        return await _rpc(self._proxy, 'loadwallet', name)
 
-    def get_balance(self) -> dict:
+    async def get_balance(self) -> dict:
         """
         Get the balance of the current wallet.
 
@@ -170,9 +405,9 @@ class Wallet():
         dict
             Dictionary with a lists of wallets
         """
-        return self._wrapper_executor(self.proxy.getbalance)
+        return await _rpc(self._proxy, 'getbalance')
 
-    def get_address(self) -> str:
+    async def get_address(self) -> str:
         """
         Get the current address of the wallet.
 
@@ -181,9 +416,9 @@ class Wallet():
         str
             Current address of the wallet.
         """
-        return self._wrapper_executor(self.proxy.getaddress)
+        return await _rpc(self._proxy, 'getaddress')
 
-    def get_private_key(self) -> str:
+    async def get_private_key(self) -> str:
         """
         Get the current private key of the wallet.
 
@@ -192,9 +427,9 @@ class Wallet():
         str
             Current private key of the wallet.
         """
-        return self._wrapper_executor(self.proxy.dumpprivkey)
+        return await _rpc(self._proxy, 'dumpprivkey')
 
-    def get_public_key(self) -> str:
+    async def get_public_key(self) -> str:
         """
         Get the current public key of the wallet.
 
@@ -203,9 +438,9 @@ class Wallet():
         str
             Current public key of the wallet.
         """
-        return self._wrapper_executor(self.proxy.getpubkey)
+        return await _rpc(self._proxy, 'getpubkey')
 
-    def get_wallet_info(self) -> dict:
+    async def get_wallet_info(self) -> dict:
         """
         Get the current wallet information.
 
@@ -214,9 +449,22 @@ class Wallet():
         dict
             Current wallet information.
         """
-        return self._wrapper_executor(self.proxy.getwalletinfo)
+        return await _rpc(self._proxy, 'getwalletinfo')
+
+    async def snapshot(self) -> dict:
+        """
+        Get the wallet information and balance in a single round-trip.
+
+        Returns
+        -------
+        dict
+            Dictionary with `info` and `balance` of the wallet.
+        """
+        info, balance = await self._batch([('getwalletinfo', []),
+                                           ('getbalance', [])])
+        return {"info": info, "balance": balance}
 
-    def send_to_address(self, address: str, amount: float) -> str:
+    async def send_to_address(self, address: str, amount: float) -> str:
         """
         Send a transaction to a given address.
         TODO: Validate the input address.
@@ -233,8 +481,7 @@ class Wallet():
         str
             Transaction ID.
         """
-        return self._wrapper_executor(self.proxy.sendtoaddress, 
-            address, amount)
+        return await _rpc(self._proxy, 'sendtoaddress', address, amount)
 
 
 class Pool:
@@ -269,8 +516,8 @@ class Pool:
         """
         return self._vault_wallet
 
-    def issue_token(self, amount: Union[str, float], 
-                    reissue: Union[str, float]) -> dict:
+    async def issue_token(self, amount: Union[str, float],
+                          reissue: Union[str, float]) -> dict:
         """
         Issue a token from the pool wallet.
 
@@ -286,5 +533,24 @@ class Pool:
         dict
             Token metadata result.
         """
-        return self._vault_wallet._wrapper_executor(
-            self._vault_wallet.proxy.issueasset, amount, reissue)
+        return await _rpc(self._vault_wallet.proxy, 'issueasset', amount,
+                          reissue)
+
+
+@ttl_cache(ttl=LISTING_TTL)
+async def cached_list_wallets(proxy_service: httpx.AsyncClient) -> dict:
+    """
+    Get all saved wallets at node directory, sharing the answer for
+    `LISTING_TTL` seconds.
+
+    Parameters
+    ----------
+    proxy_service: httpx.AsyncClient
+        Pooled RPC client to be used for the call.
+
+    Returns
+    -------
+    dict
+        Dictionary with a lists of wallets.
+    """
+    return await Wallet(proxy_service).list_wallets()
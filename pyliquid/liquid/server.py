@@ -3,6 +3,7 @@ Sub module with everything related with serving and managing the underlying
 infrastructure of a running Liquid node.
 """
 
+import asyncio
 import os
 import sys
 import subprocess
@@ -11,11 +12,14 @@ from datetime import datetime
 import logging
 from typing import Optional
 
-from bitcoinrpc.authproxy import AuthServiceProxy  # type: ignore
-from pyliquid.liquid.wrappers import cli_exec
+import httpx
+from pyliquid.liquid.wrappers import cli_exec, ttl_cache
 from pyliquid.utils.misc import get_configs
 
 DEFAULT_LOCATION = f"{os.environ['HOME']}/.elements"
+RPC_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+RPC_TIMEOUT = 30
+STATUS_TTL = 2.0
 
 
 class Service():
@@ -78,13 +82,16 @@ class Service():
         """
         try:
             with open(f"{network_path}/elements.conf", 'r') as confs:
-                mode = [v for v in confs.readlines() if v.startswith('chain=')]
+                # Stops reading at the first match instead of loading it all.
+                mode = next(v for v in confs if v.startswith('chain='))
             logging.info(f"Initializating Chain in mode: \
-                {mode[0].split('=')[-1]}\nLocated at directory: \
-                    {network_path}/{mode[0]}\n")
+                {mode.split('=')[-1]}\nLocated at directory: \
+                    {network_path}/{mode}\n")
         except FileNotFoundError:
             logging.error("Verify that there's a `.conf` file at the specified\
                             path\n")
+        except StopIteration:
+            logging.error("Verify that the `.conf` file sets a `chain=`\n")
 
     @classmethod
     @cli_exec
@@ -100,6 +107,20 @@ class Service():
         cmd = "pgrep -u $USER 'elementsd'"
         return subprocess.run(cmd, capture_output=True, check=True, shell=True)
 
+    @staticmethod
+    @ttl_cache(ttl=STATUS_TTL)
+    async def is_running() -> bool:
+        """
+        Check if the daemon is running without blocking the event loop.
+        The answer is shared for `STATUS_TTL` seconds.
+
+        Returns
+        -------
+        bool
+            Wether the daemon is running or not.
+        """
+        return bool(await asyncio.to_thread(Service._is_running))
+
     @classmethod
     @cli_exec
     def _start_daemon(cls, input_path: Optional[str] = None) \
@@ -140,9 +161,11 @@ class Service():
 
     @staticmethod
     def get_proxy(host: Optional[str] = 'localhost',
-                  auth_dict: Optional[dict] = None) -> AuthServiceProxy:
+                  auth_dict: Optional[dict] = None) -> httpx.AsyncClient:
         """
-        Return RPC Connection instance with active node
+        Return a pooled RPC Connection instance with active node. The client
+        keeps its connections alive, so it should be created once and shared
+        across requests.
 
         Parameters
         ----------
@@ -157,19 +180,21 @@ class Service():
 
         Returns
         -------
-        AuthServiceProxy
-            Authenticated Proxy Service object.
+        httpx.AsyncClient
+            Authenticated HTTP client speaking JSON-RPC with the node.
         """
         if (host != 'localhost') and (auth_dict):
             raise ValueError(
                 'Either provide a custom host or parameters to be used by \
                 `localhost`\n')
-        else:
+        _auth = None
+        if host == 'localhost':
             if not auth_dict:
                 auth_dict = get_configs(['rpc_port', 'rpc_user',
                                               'rpc_password'])
-            _cred = f"{auth_dict['rpc_user']}:{auth_dict['rpc_password']}"
-            host = f"http://{_cred}@127.0.0.1:{auth_dict['rpc_port']}"
-        asp = AuthServiceProxy(host)
+            _auth = (auth_dict['rpc_user'], auth_dict['rpc_password'])
+            host = f"http://127.0.0.1:{auth_dict['rpc_port']}"
+        client = httpx.AsyncClient(base_url=host, auth=_auth, limits=RPC_LIMITS,
+                                   timeout=RPC_TIMEOUT)
         logging.info(f"[{datetime.now()}] Proxy service created at: {host}\n")
-        return asp
+        return client
@@ -1,14 +1,43 @@
+import asyncio
 import subprocess
 import json
-from typing import Callable, Optional, Union
+from functools import wraps
+from typing import Callable, Dict, Hashable, Optional, Union
 import logging
 
-from bitcoinrpc.authproxy import JSONRPCException  # type: ignore
+from cachetools import TTLCache  # type: ignore
+from pyliquid.utils.exceptions import JSONRPCError
+
+_MISSING = object()
+
+
+class _Flight():
+    """
+    State shared by the calls to a cached coroutine with the same key.
+
+    Attributes
+    ----------
+    lock: asyncio.Lock
+        Lets a single call reach upstream at a time.
+    waiters: int
+        Calls currently holding or waiting for the lock.
+    generation: int
+        Number of upstream executions finished so far.
+    output: Any
+        Output of the latest upstream execution, even if not cached.
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.waiters = 0
+        self.generation = 0
+        self.output = None
 
 
 def rpc_exec(_func: Callable) -> Callable:
     """
-    Wrapper for RPC functions calling, simplifying error management.
+    Wrapper for asynchronous RPC functions calling, simplifying error
+    management.
 
     Parameters
     ----------
@@ -20,18 +49,15 @@ def rpc_exec(_func: Callable) -> Callable:
     Callable
         Original function already wrapped.
     """
-    def wrap(obj, _caller: Callable, *args):
+    @wraps(_func)
+    async def wrap(*args):
         """
-        Internal function that handles RPC errors.
+        Internal coroutine that handles RPC errors.
 
         Parameters
         ----------
-        obj: cls
-            Class object from which the method is being call.
-        _caller: Callable
-            The actual instance method to use for execution.
         args:
-            Parameter for `_caller` function.
+            Parameters for `_func`, passed down as they are.
 
         Returns
         -------
@@ -39,8 +65,8 @@ def rpc_exec(_func: Callable) -> Callable:
             Output from RPC call.
         """
         try:
-            return _func(obj, _caller, args)
-        except JSONRPCException as json_exception:
+            return await _func(*args)
+        except JSONRPCError as json_exception:
             logging.error(f"A JSON RPC Exception occured: {json_exception}\n")
         except Exception as general_exception:
             logging.exception(f"An Exception occured: {general_exception}\n")
@@ -90,3 +116,72 @@ def cli_exec(_func: Callable) -> Callable:
                 logging.warning(f"Skipping exception code \
                     ({stderr.returncode}) with no output error...\n")
     return wrap
+
+
+def ttl_cache(ttl: float, maxsize: int = 8) -> Callable:
+    """
+    Wrapper for caching coroutine outputs during a short period of time.
+    Concurrent calls missing the cache with the same arguments wait for a
+    single execution instead of each reaching the node. `None` outputs,
+    given by failed RPC calls, are not cached.
+
+    Parameters
+    ----------
+    ttl: float
+        Seconds for an output to be kept.
+    maxsize: int, default = 8
+        Maximum number of different arguments to be kept.
+
+    Returns
+    -------
+    Callable
+        Decorator for the coroutine function to be cached.
+    """
+    def decorator(_func: Callable) -> Callable:
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        flights: Dict[Hashable, _Flight] = {}
+
+        @wraps(_func)
+        async def wrap(*args):
+            """
+            Internal coroutine that serves outputs from cache when fresh.
+
+            Parameters
+            ----------
+            args:
+                Hashable parameters for `_func`, used as cache key.
+
+            Returns
+            -------
+            Any
+                Output from `_func`.
+            """
+            output = cache.get(args, _MISSING)
+            if output is not _MISSING:
+                return output
+            flight = flights.setdefault(args, _Flight())
+            flight.waiters += 1
+            seen = flight.generation
+            try:
+                async with flight.lock:
+                    # Share an execution that finished while waiting, even
+                    # a failed one that was kept out of the cache.
+                    if flight.generation != seen:
+                        return flight.output
+                    output = cache.get(args, _MISSING)
+                    if output is _MISSING:
+                        output = await _func(*args)
+                        # Failed RPC calls give None, which must not be
+                        # served after this flight.
+                        if output is not None:
+                            cache[args] = output
+                        flight.output = output
+                        flight.generation += 1
+                    return output
+            finally:
+                flight.waiters -= 1
+                # Drop the flight once idle so its key is not kept alive.
+                if not flight.waiters and flights.get(args) is flight:
+                    del flights[args]
+        return wrap
+    return decorator
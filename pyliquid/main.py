@@ -1,3 +1,5 @@
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
 import logging
 from typing import Dict
@@ -6,14 +8,16 @@ from dotenv import load_dotenv  # type: ignore
 
 from pyliquid.routers import health, node, operations
 from pyliquid.liquid import server
+from pyliquid.liquid.operations import Wallet
 
 PROJECT_PATH = "PyLiquid2EVM"
+STARTUP_ATTEMPTS = 6
+STARTUP_BACKOFF = 0.5
 
-_base_path = str(Path(__file__)).split('/')
-_filter_path = ['/'.join(_base_path[:i]) for i in range(1, len(_base_path))
-                if PROJECT_PATH not in _base_path[:i]][-1]
-
-BACKEND_PATH = f"{_filter_path}/{PROJECT_PATH}"
+_here = Path(__file__).resolve()
+# Falls back to the repository root when cloned under another name.
+BACKEND_PATH = next((p for p in _here.parents if p.name == PROJECT_PATH),
+                    _here.parents[1])
 
 app = FastAPI()
 
@@ -28,8 +32,39 @@ async def startup_event():
     Startup script to be executed when API is initialized.
     """
     logging.basicConfig(level=logging.INFO)
-    load_dotenv(f"{BACKEND_PATH}/.env")
+    load_dotenv(str(BACKEND_PATH / ".env"))
     server.Service()
+    app.state.rpc = server.Service.get_proxy()
+    app.state.wallets = OrderedDict()
+    # Opens the pooled connection and checks the node answers before the
+    # first request does. Wallets on disk are registered to load lazily.
+    # A node just started refuses connections or is still warming up.
+    delay = STARTUP_BACKOFF
+    for attempt in range(1, STARTUP_ATTEMPTS + 1):
+        listing = await Wallet(app.state.rpc).list_wallets()
+        if listing is not None:
+            break
+        if attempt < STARTUP_ATTEMPTS:
+            logging.info(f"Node RPC not ready (attempt {attempt}), \
+                retrying in {delay}s\n")
+            await asyncio.sleep(delay)
+            delay *= 2
+    else:
+        logging.warning(f"Node RPC did not answer `listwalletdir` after \
+            {STARTUP_ATTEMPTS} attempts, wallets were not registered\n")
+        return
+    for _wallet in listing['wallets']:
+        app.state.wallets[_wallet['name']] = Wallet(app.state.rpc, 'l',
+                                                    _wallet['name'])
+    logging.info(f"Registered {len(app.state.wallets)} wallets from node\n")
+
+
+@app.on_event('shutdown')
+async def shutdown_event():
+    """
+    Shutdown script to release the RPC connection pool.
+    """
+    await app.state.rpc.aclose()
 
 
 @app.get('/')
@@ -22,10 +22,10 @@ async def node_health_status():
 
     Returns
     -------
-    AuthServiceProxy
-        Latest Proxy Service instance.
+    SuccessGet
+        Confirmation that the node is up.
     """
-    if Service._is_running():
+    if await Service.is_running():
         return SuccessGet(status=status.HTTP_200_OK)
     else:
         raise HTTPException(status_code=400, detail="Node is not running")
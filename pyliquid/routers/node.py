@@ -2,9 +2,9 @@
 Set of endpoints for managing the Liquid node.
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 
-from pyliquid.routers.share import RESPONSES
+from pyliquid.routers.share import RESPONSES, get_session_wallets
 from pyliquid.liquid.server import Service
 from pyliquid.models import requests, responses
 
@@ -15,9 +15,11 @@ router = APIRouter(
 )
 
 @router.post("/restart")
-def restart_node():
+def restart_node(request: Request):
     """
-    Restart the running instance of Liquid node.
+    Restart the running instance of Liquid node. Wallets opened during the
+    session are forgotten, as the new node starts with none loaded.
     """
+    get_session_wallets(request).clear()
     _ = Service()
     return responses.SuccessPost(status.HTTP_201_CREATED)
\ No newline at end of file
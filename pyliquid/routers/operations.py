@@ -5,12 +5,12 @@ Set of endpoints for operations with Liquid.
 import json
 import logging
 from typing import Optional, Union
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel
 
-from pyliquid.routers.share import RESPONSES
-from pyliquid.liquid.server import Service
-from pyliquid.liquid.operations import Wallet
+from pyliquid.routers.share import (RESPONSES, get_proxy, get_session_wallets,
+                                    update_session_wallets)
+from pyliquid.liquid.operations import Wallet, cached_list_wallets
 from pyliquid.models import responses
 from pyliquid.utils.data import parse_decimal_to_float
 
@@ -24,27 +24,27 @@ class SendTx(BaseModel):
     total_amount: Union[str, float]
 
 
-def get_wallet_instance(wallet_mode: str, 
-                        target_label: Optional[str] = None) -> Wallet:
+async def get_wallet_instance(request: Request, wallet_mode: str,
+                              target_label: Optional[str] = None) -> Wallet:
     """
-    Return wallet instance depending on specified mode.
+    Return wallet instance depending on specified mode, using the RPC
+    client shared by the whole app.
     """
-    _proxy = Service.get_proxy()
+    _proxy = await get_proxy(request)
     if target_label:
-        return Wallet(_proxy, wallet_mode, target_label)
+        return await Wallet(_proxy, wallet_mode, target_label).open()
     else:
-        return Wallet(_proxy, wallet_mode)
+        return await Wallet(_proxy, wallet_mode).open()
 
 @router.get("/wallet", tags=["wallet"])
-async def get_wallet():
+async def get_wallet(request: Request):
     """
     List active wallets on the node.
 
     TODO: This should only be callable by admin.
     """
     try:
-        _instance = get_wallet_instance('r')
-        output = _instance.list_wallets()
+        output = await cached_list_wallets(await get_proxy(request))
         print(f"The output is: {output}\n")
         return responses.SuccessGet(status=status.HTTP_200_OK, 
                                     payload=json.dumps(output))
@@ -53,46 +53,75 @@ async def get_wallet():
         raise HTTPException(500)
 
 @router.get("/wallet/", tags=["wallet"])
-async def get_labeled_wallet(wallet_label: str):
+async def get_labeled_wallet(request: Request, wallet_label: str):
     """
-    Returns an specific wallet metadata.
+    Returns an specific wallet metadata. Wallets already opened during the
+    session are reused, otherwise it gets loaded from the node.
     """
     try:
-        _instance = get_wallet_instance('l', wallet_label)
+        session_wallets = get_session_wallets(request)
+        _instance = session_wallets.get(wallet_label)
+        output = None
+        if _instance is not None and _instance.wallet:
+            output = await _instance.get_wallet_info()
+            if output is None:
+                # The node may have restarted or unloaded it since then.
+                del session_wallets[wallet_label]
+            else:
+                session_wallets.move_to_end(wallet_label)
+        # Unknown labels, placeholders registered at startup and stale ones.
+        if output is None:
+            _instance = await get_wallet_instance(request, 'l', wallet_label)
+            if not _instance.wallet:
+                raise HTTPException(status_code=404,
+                                    detail="Wallet not found")
+            update_session_wallets(request, _instance)
+            output = await _instance.get_wallet_info()
+            if output is None:
+                raise HTTPException(status_code=500,
+                                    detail="Wallet information unavailable")
         return responses.SuccessGet(status=status.HTTP_200_OK,
-                        payload=json.dumps(parse_decimal_to_float(
-                                                _instance.get_wallet_info())))
+                        payload=json.dumps(parse_decimal_to_float(output)))
+    except HTTPException:
+        raise
     except Exception as exp:
         logging.error(exp)
         raise HTTPException(500)
 
 @router.post("/wallet/create", tags=["wallet"])
-async def post_create_wallet():
+async def post_create_wallet(request: Request):
     """
     Creates a new Wallet instance
 
     TODO: Only callable by admin.
     """
     try:
-        _instance = get_wallet_instance('c')
+        _instance = await get_wallet_instance(request, 'c')
+        if not _instance.wallet:
+            raise HTTPException(status_code=500,
+                                detail="Wallet could not be created")
+        update_session_wallets(request, _instance)
         return responses.SuccessPost(status=status.HTTP_200_OK,
                                 payload=json.dumps(
                                     parse_decimal_to_float(
-                                        _instance.get_wallet_info())))
+                                        await _instance.get_wallet_info())))
+    except HTTPException:
+        raise
     except Exception as exp:
         logging.error(exp)
         raise HTTPException(500)
 
 @router.post("/tx/send", tags=["tx"])
-async def post_send_transaction(incoming_body: SendTx):
+async def post_send_transaction(request: Request,
+                                incoming_body: SendTx):
     """
     Send tokens from the node Wallet to given address.
     """
     try:
-        _instance = get_wallet_instance('r')
+        _instance = await get_wallet_instance(request, 'r')
         return responses.SuccessPost(status=status.HTTP_200_OK,
                                 payload=json.dumps(
-                                    _instance.send_to_address(
+                                    await _instance.send_to_address(
                                         incoming_body.target_address, 
                                         incoming_body.total_amount)))
     except Exception as exp:
@@ -2,8 +2,78 @@
 Set of elements being shared by more than one Router
 """
 
+import asyncio
+from collections import OrderedDict
+
+import httpx
+from fastapi import Request
+
+from pyliquid.liquid.operations import Wallet
+from pyliquid.liquid.server import Service
+
 RESPONSES = {
     404: {"description": "Resource not found"},
     500: {"description": "There was an error processing your request. \
         Please try again!"}
-}
\ No newline at end of file
+}
+
+_proxy_lock = asyncio.Lock()
+
+
+async def get_proxy(request: Request) -> httpx.AsyncClient:
+    """
+    Return the RPC client shared by the app, lazily creating it when it
+    is missing or was already closed. Creation is guarded by a lock, so
+    concurrent requests on a cold start end up sharing a single client.
+    Session wallets are moved to the new client.
+
+    Parameters
+    ----------
+    request: Request
+        Incoming request, used to reach the app state.
+
+    Returns
+    -------
+    httpx.AsyncClient
+    """
+    state = request.app.state
+    if getattr(state, 'rpc', None) is None or state.rpc.is_closed:
+        async with _proxy_lock:
+            if getattr(state, 'rpc', None) is None or state.rpc.is_closed:
+                state.rpc = Service.get_proxy()
+                for wallet in getattr(state, 'wallets', {}).values():
+                    wallet.proxy = state.rpc
+    return state.rpc
+
+
+def get_session_wallets(request: Request) -> "OrderedDict[str, Wallet]":
+    """
+    Return the wallets opened during this session, indexed by label.
+    The most recently used wallet is always the last one.
+
+    Parameters
+    ----------
+    request: Request
+        Incoming request, used to reach the app state.
+
+    Returns
+    -------
+    OrderedDict[str, Wallet]
+    """
+    return request.app.state.wallets
+
+
+def update_session_wallets(request: Request, wallet: Wallet) -> None:
+    """
+    Register a wallet in the session, marking it as the latest one.
+
+    Parameters
+    ----------
+    request: Request
+        Incoming request, used to reach the app state.
+    wallet: Wallet
+        Opened wallet to be indexed by its label.
+    """
+    session_wallets = get_session_wallets(request)
+    session_wallets[wallet.label] = wallet
+    session_wallets.move_to_end(wallet.label)
@@ -1,3 +1,19 @@
 """
 This file will defined custom Error Types
 """
+
+
+class JSONRPCError(Exception):
+    """
+    Error returned by the node when executing a JSON-RPC call.
+
+    Attributes
+    ----------
+    error: dict
+        Raw `error` object from the RPC response, with `code` and `message`.
+    """
+
+    def __init__(self, rpc_error: dict) -> None:
+        self.error = rpc_error
+        super().__init__(f"{rpc_error.get('message')} "
+                         f"(code {rpc_error.get('code')})")
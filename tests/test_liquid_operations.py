@@ -0,0 +1,103 @@
+"""
+Suite of tests for module operations from subpackage liquid
+"""
+
+# General imports
+import asyncio
+import json
+from decimal import Decimal
+import httpx
+# Module imports
+from pyliquid.liquid.operations import Wallet, _rpc
+
+
+def reply(call, result=None, error=None):
+    """
+    Build a JSON-RPC reply object for a given call.
+    """
+    return {"result": result, "error": error, "id": call['id']}
+
+
+def node_client(handler):
+    """
+    Build a client whose requests are answered by `handler`.
+    """
+    def transport(request):
+        return handler(json.loads(request.content))
+    return httpx.AsyncClient(base_url="http://node",
+                             transport=httpx.MockTransport(transport))
+
+
+def test_batch_matches_replies_by_id():
+    """
+    Test that batch outputs follow call order, with None on failed calls
+    """
+    def handler(calls):
+        replies = [reply(c, error={"code": -4, "message": "failed"})
+                   if c['method'] == 'getbalance'
+                   else reply(c, result=c['method']) for c in calls]
+        return httpx.Response(200, json=list(reversed(replies)))
+
+    outputs = asyncio.run(Wallet(node_client(handler))._batch([
+        ('getwalletinfo', []), ('getbalance', []), ('getnewaddress', [])]))
+    assert outputs == ['getwalletinfo', None, 'getnewaddress']
+
+
+def test_batch_rejected_as_a_whole():
+    """
+    Test that a rejected batch or missing replies give None outputs
+    """
+    def rejected(calls):
+        return httpx.Response(500, json={"result": None, "id": None,
+                                         "error": {"code": -32700,
+                                                   "message": "Parse error"}})
+
+    def partial(calls):
+        return httpx.Response(200, json=[reply(calls[0], result="info")])
+
+    calls = [('getwalletinfo', []), ('getbalance', [])]
+    assert asyncio.run(Wallet(node_client(rejected))._batch(calls)) \
+        == [None, None]
+    assert asyncio.run(Wallet(node_client(partial))._batch(calls)) \
+        == ["info", None]
+
+
+def test_create_wallet_failure():
+    """
+    Test that no address is kept when the wallet could not be created
+    """
+    def handler(calls):
+        return httpx.Response(200, json=[
+            reply(calls[0], error={"code": -4, "message": "exists"}),
+            reply(calls[1], result="other_wallet_address")])
+
+    wallet = asyncio.run(Wallet(node_client(handler), 'c', 'label').open())
+    assert not wallet.wallet
+
+
+def test_rpc_error_returns_none():
+    """
+    Test that a JSON-RPC error is handled and gives None
+    """
+    def handler(call):
+        return httpx.Response(500, json=reply(
+            call, error={"code": -18, "message": "not found"}))
+
+    assert asyncio.run(_rpc(node_client(handler), 'loadwallet', 'x')) is None
+
+
+def test_rpc_keeps_decimal_amounts():
+    """
+    Test that amounts are sent and received as Decimal, as the node does
+    """
+    sent = []
+
+    def handler(call):
+        sent.append(call['params'])
+        return httpx.Response(200, content=b'{"result": {"balance": '
+                              b'0.12345678}, "error": null, "id": 0}')
+
+    output = asyncio.run(_rpc(node_client(handler), 'sendtoaddress', 'addr',
+                              Decimal("0.12345678")))
+    assert sent == [['addr', 0.12345678]]
+    assert output == {"balance": Decimal("0.12345678")}
@@ -0,0 +1,75 @@
+"""
+Suite of tests for module wrappers from subpackage liquid
+"""
+
+# General imports
+import asyncio
+# Module imports
+from pyliquid.liquid.wrappers import ttl_cache
+
+
+def test_ttl_cache_single_flight():
+    """
+    Test that concurrent misses share one execution until the TTL expires
+    """
+    calls = []
+
+    @ttl_cache(ttl=0.1)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f"value_{key}"
+
+    async def run():
+        first = await asyncio.gather(*[fetch("a") for _ in range(10)])
+        second = await fetch("b")
+        await asyncio.sleep(0.15)
+        third = await fetch("a")
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert first == ["value_a"] * 10
+    assert second == "value_b"
+    assert third == "value_a"
+    assert calls == ["a", "b", "a"]
+
+
+def test_ttl_cache_skips_none():
+    """
+    Test that failed calls returning None are retried on the next call
+    """
+    calls = []
+
+    @ttl_cache(ttl=10)
+    async def fetch(key):
+        calls.append(key)
+        return None if len(calls) == 1 else f"value_{key}"
+
+    async def run():
+        return await fetch("a"), await fetch("a"), await fetch("a")
+
+    assert asyncio.run(run()) == (None, "value_a", "value_a")
+    assert calls == ["a", "a"]
+
+
+def test_ttl_cache_single_flight_on_failure():
+    """
+    Test that concurrent callers share a failed call, which is not cached
+    """
+    calls = []
+
+    @ttl_cache(ttl=10)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return None
+
+    async def run():
+        first = await asyncio.gather(*[fetch("a") for _ in range(10)])
+        second = await fetch("a")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == [None] * 10
+    assert second is None
+    assert calls == ["a", "a"]
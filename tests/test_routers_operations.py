@@ -0,0 +1,98 @@
+"""
+Suite of tests for endpoints from module operations of subpackage routers
+"""
+
+# General imports
+import asyncio
+import json
+from collections import OrderedDict
+import httpx
+# Module imports
+from pyliquid.main import app
+
+
+class Node:
+    """
+    Minimal node answering wallet calls, keeping track of loaded wallets.
+    """
+
+    def __init__(self, on_disk):
+        self.on_disk = set(on_disk)
+        self.loaded = set()
+        self.calls = []
+
+    def __call__(self, request):
+        call = json.loads(request.content)
+        _method, params = call['method'], call['params']
+        self.calls.append(_method)
+        result, error = None, None
+        if _method == 'loadwallet':
+            if params[0] not in self.on_disk:
+                error = {"code": -18, "message": "Wallet not found"}
+            else:
+                self.loaded.add(params[0])
+                result = {"name": params[0], "warning": ""}
+        elif _method == 'listwallets':
+            result = sorted(self.loaded)
+        elif _method == 'getwalletinfo':
+            if not self.loaded:
+                error = {"code": -18, "message": "No wallet is loaded"}
+            else:
+                result = {"walletname": sorted(self.loaded)[0]}
+        return httpx.Response(500 if error else 200, json={
+            "result": result, "error": error, "id": call['id']})
+
+
+def run_requests(node, labels):
+    """
+    Request each wallet label in turn, returning the status codes.
+    """
+    app.state.rpc = httpx.AsyncClient(base_url="http://node",
+                                      transport=httpx.MockTransport(node))
+    app.state.wallets = OrderedDict()
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                   base_url="http://test")
+        codes = []
+        for label in labels:
+            if label is None:
+                node.loaded.clear()  # Node restarted.
+                continue
+            response = await client.get("/operations/wallet/",
+                                        params={"wallet_label": label})
+            codes.append(response.status_code)
+        return codes
+
+    return asyncio.run(run())
+
+
+def test_labeled_wallet_is_indexed():
+    """
+    Test that a wallet is loaded once and then served from the session,
+    keeping the latest one last
+    """
+    node = Node(["first", "second"])
+    assert run_requests(node, ["first", "second", "first"]) == [200] * 3
+    assert node.calls == ["loadwallet", "getwalletinfo", "loadwallet",
+                          "getwalletinfo", "getwalletinfo"]
+    assert list(app.state.wallets) == ["second", "first"]
+
+
+def test_labeled_wallet_unknown():
+    """
+    Test that an unknown label is not found and not registered
+    """
+    node = Node(["first"])
+    assert run_requests(node, ["missing"]) == [404]
+    assert not app.state.wallets
+
+
+def test_labeled_wallet_after_restart():
+    """
+    Test that a session wallet is loaded again once the node forgot it
+    """
+    node = Node(["first"])
+    assert run_requests(node, ["first", None, "first", "first"]) \
+        == [200, 200, 200]
+    assert node.calls.count("loadwallet") == 2
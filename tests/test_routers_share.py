@@ -0,0 +1,56 @@
+"""
+Suite of tests for module share from subpackage routers
+"""
+
+# General imports
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+import httpx
+# Module imports
+from pyliquid.liquid.operations import Wallet
+from pyliquid.routers import share
+
+
+def test_get_proxy_lazy_single_client(monkeypatch):
+    """
+    Test that concurrent cold-start calls create and share one client
+    """
+    created = []
+
+    def get_proxy():
+        created.append(httpx.AsyncClient())
+        return created[-1]
+
+    monkeypatch.setattr(share.Service, "get_proxy", staticmethod(get_proxy))
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+    async def run():
+        return await asyncio.gather(*[share.get_proxy(request)
+                                      for _ in range(20)])
+
+    clients = asyncio.run(run())
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+
+
+def test_get_proxy_replaces_closed_client(monkeypatch):
+    """
+    Test that a closed client is replaced, also for session wallets
+    """
+    monkeypatch.setattr(share.Service, "get_proxy",
+                        staticmethod(httpx.AsyncClient))
+    closed = httpx.AsyncClient()
+    wallet = Wallet(closed, 'l', 'first')
+    state = SimpleNamespace(rpc=closed,
+                            wallets=OrderedDict(first=wallet))
+    request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+    async def run():
+        await closed.aclose()
+        return await share.get_proxy(request)
+
+    client = asyncio.run(run())
+    assert client is not closed and not client.is_closed
+    assert state.rpc is client
+    assert wallet.proxy is client